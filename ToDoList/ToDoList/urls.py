@@ -15,6 +15,7 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
+from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from django.urls import path, include
 
 urlpatterns = [
@@ -22,3 +23,7 @@ urlpatterns = [
     path('account/', include('account.urls')),
     path('todo/', include('todo_app.urls')),
 ]
+
+# uvicorn does not serve static files like runserver does; this only adds
+# patterns when DEBUG is on.
+urlpatterns += staticfiles_urlpatterns()
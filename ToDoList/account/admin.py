@@ -1,4 +1,27 @@
 from django.contrib import admin
 from account.models import User
 
-admin.site.register(User)
+
+@admin.register(User)
+class UserAdmin(admin.ModelAdmin):
+    """
+    User changelist that searches by the indexed email column and skips
+    the extra full-table COUNT(*) when a filter or search is applied.
+    """
+    list_display = ["email", "first_name", "last_name", "is_staff",
+                    "is_active", "date_joined"]
+    list_filter = ["is_staff", "is_active"]
+    search_fields = ["email__startswith"]
+    ordering = ["-id"]
+    show_full_result_count = False
+    actions = ["activate_users", "deactivate_users"]
+
+    @admin.action(description="Activate selected users")
+    def activate_users(self, request, queryset):
+        updated = queryset.update(is_active=True)
+        self.message_user(request, f"{updated} user(s) activated.")
+
+    @admin.action(description="Deactivate selected users")
+    def deactivate_users(self, request, queryset):
+        updated = queryset.update(is_active=False)
+        self.message_user(request, f"{updated} user(s) deactivated.")
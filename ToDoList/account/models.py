@@ -19,5 +19,11 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     objects = CustomUserManager()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["is_staff"]),
+            models.Index(fields=["is_active"]),
+        ]
+
     def __str__(self):
         return self.email
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+from collections import defaultdict
+
+from django.db import transaction
+from django.urls import reverse
+
+
+class TaskEventBroker:
+    """
+    In-process publish/subscribe hub for task change events.
+
+    Subscribers are asyncio queues keyed by owner id, each bound to the
+    event loop that created it. publish() may be called from any thread
+    (sync views run in a worker thread under ASGI), so events are handed
+    to the subscriber's loop with call_soon_threadsafe.
+
+    Events only reach subscribers in the same process; every ASGI worker
+    keeps its own broker.
+    """
+
+    def __init__(self, max_queue_size=100):
+        self.max_queue_size = max_queue_size
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, owner_id):
+        """Register and return a new queue for owner_id's events."""
+        queue = asyncio.Queue(maxsize=self.max_queue_size)
+        queue.loop = asyncio.get_running_loop()
+        with self._lock:
+            self._subscribers[owner_id].add(queue)
+        return queue
+
+    def unsubscribe(self, owner_id, queue):
+        with self._lock:
+            queues = self._subscribers.get(owner_id)
+            if queues is None:
+                return
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[owner_id]
+
+    def publish(self, owner_id, event):
+        """Send event to every subscriber of owner_id."""
+        with self._lock:
+            queues = list(self._subscribers.get(owner_id, ()))
+        for queue in queues:
+            try:
+                queue.loop.call_soon_threadsafe(self._put, queue, event)
+            except RuntimeError:
+                # The subscriber's loop has been closed.
+                self.unsubscribe(owner_id, queue)
+
+    @staticmethod
+    def _put(queue, event):
+        # A subscriber that does not keep up loses events instead of
+        # growing its queue without bound.
+        if not queue.full():
+            queue.put_nowait(event)
+
+
+broker = TaskEventBroker()
+
+
+def task_event(action, task):
+    """Return the event payload describing action on task."""
+    return {
+        "action": action,
+        "id": task.id,
+        "title": task.title,
+        "status": task.status,
+        "url": task.get_absolute_url(),
+        "delete_url": reverse("todo:task_delete", kwargs={"pk": task.id}),
+    }
+
+
+def publish_task(action, task):
+    """Publish action on task to its owner once the transaction commits."""
+    owner_id = task.owner_id
+    event = task_event(action, task)
+    transaction.on_commit(lambda: broker.publish(owner_id, event))
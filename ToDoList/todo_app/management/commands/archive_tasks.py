@@ -0,0 +1,118 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from todo_app.models import Task, TaskArchive
+
+
+class Command(BaseCommand):
+    """
+    Move completed tasks older than a given number of days from the Task
+    table into TaskArchive.
+
+    Rows are moved in batches ordered by id. Every batch is locked, copied
+    with INSERT ... SELECT and removed with DELETE inside its own
+    transaction, so an interrupted run can simply be started again: moved
+    rows are already gone from the Task table and the next run picks up
+    where the previous one stopped.
+    """
+    help = "Archive completed tasks older than N days into TaskArchive."
+
+    columns = ("id", "title", "owner_id", "description", "status",
+               "create_date")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=30,
+            help="Archive completed tasks created more than DAYS ago.")
+        parser.add_argument(
+            "--batch-size", type=int, default=1000,
+            help="Number of tasks moved per transaction.")
+        parser.add_argument(
+            "--sleep", type=float, default=0.0,
+            help="Seconds to pause between batches.")
+        parser.add_argument(
+            "--max-batches", type=int, default=None,
+            help="Stop after this many batches.")
+
+    def handle(self, *args, **options):
+        days = options["days"]
+        batch_size = options["batch_size"]
+        sleep = options["sleep"]
+        max_batches = options["max_batches"]
+        verbosity = options["verbosity"]
+
+        if days < 0:
+            raise CommandError("--days must not be negative.")
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        if sleep < 0:
+            raise CommandError("--sleep must not be negative.")
+
+        cutoff = timezone.now() - timedelta(days=days)
+        last_id = 0
+        batches = 0
+        moved = 0
+
+        while max_batches is None or batches < max_batches:
+            ids = self.move_batch(last_id, cutoff, batch_size)
+            if not ids:
+                break
+
+            moved += len(ids)
+            last_id = ids[-1]
+            batches += 1
+
+            if verbosity >= 2:
+                self.stdout.write(
+                    f"Batch {batches}: archived up to task id {last_id}")
+            if sleep:
+                time.sleep(sleep)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Archived {moved} task(s) in {batches} batch(es)."))
+
+    def move_batch(self, after_id, cutoff, batch_size):
+        """
+        Move up to batch_size completed tasks with an id above after_id,
+        created before cutoff, and return their ids.
+
+        The batch is locked with SELECT ... FOR UPDATE first, so a task
+        cannot change status between the copy and the delete, and only
+        rows that actually reached the archive are deleted.
+        """
+        qn = connection.ops.quote_name
+        task_table = qn(Task._meta.db_table)
+        archive_table = qn(TaskArchive._meta.db_table)
+        columns = ", ".join(qn(c) for c in self.columns)
+        adapt = connection.ops.adapt_datetimefield_value
+
+        with transaction.atomic():
+            ids = list(
+                Task.objects.select_for_update()
+                .filter(status=True, create_date__lt=cutoff, id__gt=after_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                return ids
+
+            placeholders = ", ".join(["%s"] * len(ids))
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO {archive_table} "
+                    f"({columns}, {qn('archived_at')}) "
+                    f"SELECT {columns}, %s FROM {task_table} "
+                    f"WHERE {qn('id')} IN ({placeholders})",
+                    [adapt(timezone.now()), *ids],
+                )
+                cursor.execute(
+                    f"DELETE FROM {task_table} WHERE {qn('id')} IN "
+                    f"(SELECT {qn('id')} FROM {archive_table} "
+                    f"WHERE {qn('id')} BETWEEN %s AND %s)",
+                    [ids[0], ids[-1]],
+                )
+        return ids
@@ -0,0 +1,310 @@
+import json
+import queue
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter, defaultdict
+from contextlib import nullcontext
+from datetime import datetime
+from urllib.parse import urlencode, urlsplit
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import Resolver404, resolve
+
+
+class NoRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Return 3xx responses as they are, like the Django test client."""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class Command(BaseCommand):
+    """
+    Replay a JSON-lines request log against the project's URL routes and
+    report latency and status codes per route.
+
+    Every line is an object such as:
+
+        {"timestamp": 12.5, "method": "GET", "path": "/todo/tasks/",
+         "user": "someone@example.com"}
+
+    "method" (an HTTP verb) and "path" are required; lines without them
+    are counted as skipped. "timestamp" (seconds or an ISO 8601 string)
+    keeps the original spacing between requests, divided by --speedup.
+    "data" is sent as form data, "headers" are passed through, and "user"
+    logs the request in as that user when replaying in-process.
+
+    Redirects are not followed in either mode.
+
+    Without --target the requests go through the Django test client
+    against the configured database, so point it at a scratch database.
+    The test client is a WSGI client, so routes in asgi_only_routes (the
+    task event stream answers 501 under WSGI) are counted as skipped
+    instead of being reported as server errors. With --target, event
+    streams are timed up to their headers and closed without reading the
+    body.
+    """
+    help = "Replay a JSON-lines request log and report per-route latency."
+
+    methods = {"get", "post", "put", "patch", "delete", "head", "options"}
+    asgi_only_routes = {"todo:task_events"}
+
+    def add_arguments(self, parser):
+        parser.add_argument("log", help="Path to the JSON-lines request log.")
+        parser.add_argument(
+            "--target", default=None,
+            help="Base URL of a live server, e.g. http://localhost:8000. "
+                 "Defaults to replaying in-process, which skips ASGI-only "
+                 "routes such as the task event stream.")
+        parser.add_argument(
+            "--concurrency", type=int, default=4,
+            help="Number of requests in flight at once.")
+        parser.add_argument(
+            "--speedup", type=float, default=1.0,
+            help="Divide the recorded gaps between requests by this factor. "
+                 "0 sends requests as fast as possible.")
+        parser.add_argument(
+            "--host", default="localhost",
+            help="Host header used for in-process requests.")
+        parser.add_argument(
+            "--timeout", type=float, default=30.0,
+            help="Seconds to wait for a live server response.")
+        parser.add_argument(
+            "--limit", type=int, default=None,
+            help="Stop after this many requests.")
+
+    def handle(self, *args, **options):
+        concurrency = options["concurrency"]
+        speedup = options["speedup"]
+        limit = options["limit"]
+        self.target = options["target"]
+        self.host = options["host"]
+        self.timeout = options["timeout"]
+
+        if concurrency < 1:
+            raise CommandError("--concurrency must be at least 1.")
+        if speedup < 0:
+            raise CommandError("--speedup must not be negative.")
+        if self.timeout <= 0:
+            raise CommandError("--timeout must be positive.")
+        if self.target:
+            self.target = self.target.rstrip("/")
+            self.opener = urllib.request.build_opener(NoRedirectHandler)
+
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.exceptions = defaultdict(int)
+        self.first_exception = {}
+        self.skipped = 0
+        self.skipped_asgi = 0
+
+        try:
+            log = open(options["log"], encoding="utf-8")
+        except OSError as e:
+            raise CommandError(f"Cannot read {options['log']}: {e}")
+
+        # In-process requests must pass the host validation that a real
+        # server's Host header would.
+        if self.target:
+            settings_override = nullcontext()
+        else:
+            settings_override = override_settings(ALLOWED_HOSTS=[self.host])
+
+        # A bounded queue streams the log instead of reading it up front.
+        requests = queue.Queue(maxsize=concurrency * 2)
+        workers = [
+            threading.Thread(target=self.worker, args=(requests,))
+            for _ in range(concurrency)
+        ]
+        started = time.monotonic()
+        first_timestamp = None
+        sent = 0
+
+        with log, settings_override:
+            for worker in workers:
+                worker.start()
+            try:
+                for line in log:
+                    if limit is not None and sent >= limit:
+                        break
+                    record = self.parse(line)
+                    if record is None:
+                        continue
+
+                    timestamp = record.get("timestamp")
+                    if speedup and timestamp is not None:
+                        if first_timestamp is None:
+                            first_timestamp = timestamp
+                        due = started + \
+                            (timestamp - first_timestamp) / speedup
+                        delay = due - time.monotonic()
+                        if delay > 0:
+                            time.sleep(delay)
+
+                    requests.put(record)
+                    sent += 1
+            finally:
+                for _ in workers:
+                    requests.put(None)
+                for worker in workers:
+                    worker.join()
+
+        self.report(sent, time.monotonic() - started)
+
+    def worker(self, requests):
+        try:
+            while True:
+                record = requests.get()
+                if record is None:
+                    break
+                self.replay(record)
+        finally:
+            connections.close_all()
+
+    def parse(self, line):
+        """Return the request described by line, or None to skip it."""
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict) or \
+                not isinstance(record.get("method"), str) or \
+                record["method"].lower() not in self.methods or \
+                not record.get("path"):
+            self.skipped += 1
+            return None
+        if not self.target and \
+                self.route_name(record["path"]) in self.asgi_only_routes:
+            self.skipped_asgi += 1
+            return None
+
+        timestamp = record.get("timestamp")
+        if isinstance(timestamp, str):
+            try:
+                timestamp = datetime.fromisoformat(timestamp).timestamp()
+            except ValueError:
+                timestamp = None
+        elif not isinstance(timestamp, (int, float)):
+            timestamp = None
+        record["timestamp"] = timestamp
+        return record
+
+    def route_name(self, path):
+        try:
+            match = resolve(urlsplit(path).path)
+        except Resolver404:
+            return "<unresolved>"
+        return match.view_name
+
+    def replay(self, record):
+        route = self.route_name(record["path"])
+        status = error = None
+        start = time.perf_counter()
+        try:
+            if self.target:
+                status = self.send_live(record)
+            else:
+                status = self.send_local(record)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - start
+
+        with self.lock:
+            self.latencies[route].append(elapsed)
+            if error is None:
+                self.statuses[route][f"{status // 100}xx"] += 1
+            else:
+                self.exceptions[route] += 1
+                self.first_exception.setdefault(route, error)
+
+    def send_local(self, record):
+        # The test client keeps per-instance session state and is not
+        # thread-safe, so every worker thread gets its own.
+        clients = getattr(self.local, "clients", None)
+        if clients is None:
+            clients = self.local.clients = {}
+        user = record.get("user")
+        client = clients.get(user)
+        if client is None:
+            client = Client(HTTP_HOST=self.host, raise_request_exception=False)
+            if user:
+                client.force_login(
+                    get_user_model().objects.get(email=user))
+            clients[user] = client
+
+        headers = record.get("headers") or {}
+        method = getattr(client, record["method"].lower())
+        response = method(
+            record["path"], data=record.get("data"), headers=headers)
+        return response.status_code
+
+    def send_live(self, record):
+        data = record.get("data")
+        body = None
+        headers = dict(record.get("headers") or {})
+        if data is not None:
+            body = urlencode(data, doseq=True).encode()
+            headers.setdefault(
+                "Content-Type", "application/x-www-form-urlencoded")
+        request = urllib.request.Request(
+            self.target + record["path"], data=body, headers=headers,
+            method=record["method"].upper())
+        try:
+            with self.opener.open(request, timeout=self.timeout) as response:
+                content_type = response.headers.get("Content-Type", "")
+                if not content_type.startswith("text/event-stream"):
+                    response.read()
+                return response.status
+        except urllib.error.HTTPError as e:
+            e.close()
+            return e.code
+
+    def report(self, sent, duration):
+        self.stdout.write(
+            f"Replayed {sent} request(s) in {duration:.2f}s, "
+            f"skipped {self.skipped} line(s).")
+        if self.skipped_asgi:
+            self.stdout.write(
+                f"Skipped {self.skipped_asgi} request(s) to ASGI-only routes; "
+                f"replay them with --target.")
+        if not self.latencies:
+            return
+
+        header = f"{'route':<30} {'count':>7} {'2xx':>6} {'3xx':>6} " \
+                 f"{'4xx':>6} {'5xx':>6} {'exc':>6} " \
+                 f"{'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+        self.stdout.write(header)
+        for route in sorted(self.latencies):
+            values = sorted(self.latencies[route])
+            statuses = self.statuses[route]
+            self.stdout.write(
+                f"{route:<30} {len(values):>7} "
+                f"{statuses['2xx']:>6} {statuses['3xx']:>6} "
+                f"{statuses['4xx']:>6} {statuses['5xx']:>6} "
+                f"{self.exceptions[route]:>6} "
+                f"{percentile(values, 50) * 1000:>9.1f} "
+                f"{percentile(values, 90) * 1000:>9.1f} "
+                f"{percentile(values, 99) * 1000:>9.1f} "
+                f"{values[-1] * 1000:>9.1f}")
+
+        for route in sorted(self.first_exception):
+            self.stderr.write(
+                f"{route}: {self.exceptions[route]} request(s) failed, "
+                f"first error: {self.first_exception[route]}")
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    index = max(0, -(-len(values) * percent // 100) - 1)
+    return values[int(index)]
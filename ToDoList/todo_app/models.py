@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 from django.urls import reverse
+from django.utils import timezone
 User = get_user_model()
 
 
@@ -11,8 +12,44 @@ class Task(models.Model):
     status = models.BooleanField(default=False)
     create_date = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Serves archive_tasks, which walks completed tasks in id order;
+            # create_date is auto_now_add, so it rises with id.
+            models.Index(fields=["status", "id"]),
+            # Pattern ops let PostgreSQL use the index for the admin's
+            # title__startswith search (LIKE 'x%') under any collation.
+            models.Index(
+                fields=["title"], name="todo_task_title_like_idx",
+                opclasses=["varchar_pattern_ops"]),
+        ]
+
     def __str__(self) -> str:
         return self.title
 
     def get_absolute_url(self):
-        return reverse("todo:task_detail", kwargs={"pk":self.id})
\ No newline at end of file
+        return reverse("todo:task_detail", kwargs={"pk":self.id})
+
+
+class TaskArchive(models.Model):
+    """
+    Cold storage for completed tasks moved out of the Task table by the
+    archive_tasks management command. Rows keep the id of the original
+    Task so a batch can be copied and deleted with the same predicate.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=250)
+    # Covered by the (owner, -id) index below.
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
+    description = models.TextField(blank=True)
+    status = models.BooleanField(default=True)
+    create_date = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["owner", "-id"]),
+        ]
+
+    def __str__(self) -> str:
+        return self.title
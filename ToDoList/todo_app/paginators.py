@@ -0,0 +1,49 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    A Paginator that reads the row count of an unfiltered queryset from the
+    database statistics instead of running COUNT(*), which has to scan the
+    whole table on PostgreSQL and MySQL.
+
+    The estimate is only used when it is at least estimate_threshold rows;
+    smaller tables, filtered querysets and other databases get an exact
+    count.
+    """
+    estimate_threshold = 10000
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, "query", None)
+        if query is not None and not query.where and not query.distinct:
+            estimate = self.estimated_count()
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+        return super().count
+
+    def estimated_count(self):
+        connection = connections[self.object_list.db]
+        table = self.object_list.model._meta.db_table
+        if connection.vendor == "postgresql":
+            # to_regclass resolves the name through search_path, so a
+            # table of the same name in another schema is not picked up.
+            sql = (
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = to_regclass(%s)"
+            )
+        elif connection.vendor == "mysql":
+            sql = (
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = %s"
+            )
+        else:
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [table])
+            row = cursor.fetchone()
+        if row is None or row[0] is None or row[0] < 0:
+            return None
+        return int(row[0])
@@ -1,3 +1,400 @@
-from django.test import TestCase
+import asyncio
+import json
+import tempfile
+import threading
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from account.models import User
+from todo_app.events import TaskEventBroker, broker
+from todo_app.models import Task, TaskArchive
+from todo_app.paginators import EstimatedCountPaginator
+from todo_app.views import TaskEventsView
+
+
+class ArchiveTasksCommandTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("owner@example.com", "pw")
+
+    def create_task(self, status, days_old):
+        task = Task.objects.create(
+            title="task", owner=self.user, status=status)
+        Task.objects.filter(id=task.id).update(
+            create_date=timezone.now() - timedelta(days=days_old))
+        return task
+
+    def archive(self, **options):
+        call_command("archive_tasks", stdout=StringIO(), **options)
+
+    def test_moves_only_completed_tasks_past_cutoff(self):
+        old_done = self.create_task(status=True, days_old=40)
+        old_open = self.create_task(status=False, days_old=40)
+        new_done = self.create_task(status=True, days_old=5)
+
+        self.archive(days=30)
+
+        self.assertEqual(
+            list(TaskArchive.objects.values_list("id", flat=True)),
+            [old_done.id])
+        self.assertEqual(
+            set(Task.objects.values_list("id", flat=True)),
+            {old_open.id, new_done.id})
+        archived = TaskArchive.objects.get()
+        self.assertEqual(archived.owner, self.user)
+        self.assertEqual(archived.title, "task")
+
+    def test_max_batches_limits_a_run_and_can_be_resumed(self):
+        tasks = [self.create_task(status=True, days_old=40) for _ in range(5)]
+
+        self.archive(days=30, batch_size=2, max_batches=1)
+        self.assertEqual(
+            list(TaskArchive.objects.order_by("id")
+                 .values_list("id", flat=True)),
+            [tasks[0].id, tasks[1].id])
+        self.assertEqual(Task.objects.count(), 3)
+
+        self.archive(days=30, batch_size=2)
+        self.assertEqual(TaskArchive.objects.count(), 5)
+        self.assertFalse(Task.objects.exists())
+
+    def test_rerun_without_candidates_is_a_no_op(self):
+        self.create_task(status=True, days_old=40)
+        self.archive(days=30)
+        self.archive(days=30)
+        self.assertEqual(TaskArchive.objects.count(), 1)
+        self.assertFalse(Task.objects.exists())
+
+
+class TaskArchiveListViewTest(TestCase):
+    def test_lists_only_the_owners_archived_tasks(self):
+        owner = User.objects.create_user("owner@example.com", "pw")
+        other = User.objects.create_user("other@example.com", "pw")
+        TaskArchive.objects.create(
+            id=1, title="mine", owner=owner, create_date=timezone.now())
+        TaskArchive.objects.create(
+            id=2, title="theirs", owner=other, create_date=timezone.now())
+
+        self.client.force_login(owner)
+        response = self.client.get(reverse("todo:task_archive"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [task.title for task in response.context["task_list"]], ["mine"])
+
+    def test_requires_login(self):
+        response = self.client.get(reverse("todo:task_archive"))
+        self.assertEqual(response.status_code, 302)
+
+
+class TaskEventBrokerTest(TestCase):
+    async def test_publish_reaches_only_the_owners_subscribers(self):
+        events = TaskEventBroker()
+        mine = events.subscribe(1)
+        theirs = events.subscribe(2)
+
+        events.publish(1, {"action": "created"})
+
+        self.assertEqual(
+            await asyncio.wait_for(mine.get(), 1), {"action": "created"})
+        self.assertTrue(theirs.empty())
+
+    async def test_publish_from_another_thread(self):
+        events = TaskEventBroker()
+        queue = events.subscribe(1)
+
+        thread = threading.Thread(
+            target=events.publish, args=(1, {"action": "deleted"}))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(
+            await asyncio.wait_for(queue.get(), 1), {"action": "deleted"})
+
+    async def test_unsubscribe_stops_delivery(self):
+        events = TaskEventBroker()
+        queue = events.subscribe(1)
+        events.unsubscribe(1, queue)
+
+        events.publish(1, {"action": "created"})
+        await asyncio.sleep(0)
+
+        self.assertTrue(queue.empty())
+        self.assertEqual(dict(events._subscribers), {})
+
+    async def test_full_queue_drops_events(self):
+        events = TaskEventBroker(max_queue_size=1)
+        queue = events.subscribe(1)
+
+        events.publish(1, {"action": "created"})
+        events.publish(1, {"action": "deleted"})
+        await asyncio.sleep(0)
+
+        self.assertEqual(queue.qsize(), 1)
+
+
+class TaskEventsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("owner@example.com", "pw")
+        self.client.force_login(self.user)
+
+    def test_task_changes_are_published_on_commit(self):
+        with mock.patch.object(broker, "publish") as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                task = Task.objects.create(title="task", owner=self.user)
+            with self.captureOnCommitCallbacks(execute=True):
+                task.delete()
+
+        self.assertEqual(
+            [(call.args[0], call.args[1]["action"])
+             for call in publish.call_args_list],
+            [(self.user.id, "created"), (self.user.id, "deleted")])
+
+    def test_stream_refuses_wsgi(self):
+        response = self.client.get(reverse("todo:task_events"))
+        self.assertEqual(response.status_code, 501)
+
+    async def test_stream_requires_login(self):
+        response = await self.async_client.get(reverse("todo:task_events"))
+        self.assertEqual(response.status_code, 403)
+
+    async def disconnect(self, stream):
+        # The ASGI handler cancels the pending read when the client goes.
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+
+    def create_task(self, title):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Task.objects.create(title=title, owner=self.user)
+
+    async def test_stream_sends_task_events(self):
+        await sync_to_async(self.async_client.force_login)(self.user)
+        response = await self.async_client.get(reverse("todo:task_events"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+        stream = response.streaming_content
+        self.assertEqual(await anext(stream), b"retry: 5000\n\n")
+
+        task = await sync_to_async(self.create_task)("new")
+        chunk = await asyncio.wait_for(anext(stream), 1)
+
+        self.assertTrue(chunk.startswith(b"event: task\ndata: "))
+        self.assertTrue(chunk.endswith(b"\n\n"))
+        event = json.loads(chunk.split(b"data: ", 1)[1])
+        self.assertEqual(event["action"], "created")
+        self.assertEqual(event["id"], task.id)
+
+        await self.disconnect(stream)
+        self.assertNotIn(self.user.id, broker._subscribers)
+
+    async def test_stream_sends_keep_alives(self):
+        await sync_to_async(self.async_client.force_login)(self.user)
+        with mock.patch.object(TaskEventsView, "heartbeat_interval", 0.01):
+            response = await self.async_client.get(
+                reverse("todo:task_events"))
+            stream = response.streaming_content
+            await anext(stream)
+            self.assertEqual(
+                await asyncio.wait_for(anext(stream), 1), b": keep-alive\n\n")
+            await self.disconnect(stream)
+
+    def test_fetch_create_returns_task(self):
+        response = self.client.post(
+            reverse("todo:task_create"), {"title": "new"},
+            headers={"X-Requested-With": "XMLHttpRequest"})
+
+        task = Task.objects.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["id"], task.id)
+        self.assertEqual(response.json()["action"], "created")
+
+    def test_fetch_create_returns_form_errors(self):
+        response = self.client.post(
+            reverse("todo:task_create"), {"title": ""},
+            headers={"X-Requested-With": "XMLHttpRequest"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("title", response.json()["errors"])
+
+    def test_fetch_delete_returns_deleted_task(self):
+        task = Task.objects.create(title="task", owner=self.user)
+
+        response = self.client.post(
+            reverse("todo:task_delete", kwargs={"pk": task.id}),
+            headers={"X-Requested-With": "XMLHttpRequest"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["id"], task.id)
+        self.assertEqual(response.json()["action"], "deleted")
+        self.assertFalse(Task.objects.exists())
+
+    def test_form_post_still_redirects(self):
+        response = self.client.post(
+            reverse("todo:task_create"), {"title": "new"})
+        self.assertRedirects(response, reverse("todo:tasks"))
+
+
+class ReplayCommandTest(TransactionTestCase):
+    def setUp(self):
+        User.objects.create_user("owner@example.com", "pw")
+
+    def replay(self, *records):
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl") as log:
+            for record in records:
+                log.write(json.dumps(record) + "\n")
+            log.write("not a request\n")
+            log.flush()
+            stdout, stderr = StringIO(), StringIO()
+            call_command(
+                "replay", log.name, speedup=0, host="replay.example",
+                stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def route_row(self, output, route):
+        for line in output.splitlines():
+            if line.split()[0] == route:
+                return line.split()[1:7]
+        self.fail(f"{route} missing from report")
+
+    def test_reports_status_classes_per_route(self):
+        output, _ = self.replay(
+            {"method": "GET", "path": "/todo/tasks/",
+             "user": "owner@example.com"},
+            {"method": "GET", "path": "/todo/"},
+        )
+
+        self.assertIn("Replayed 2 request(s)", output)
+        self.assertIn("skipped 1 line(s)", output)
+        # count, 2xx, 3xx, 4xx, 5xx, exceptions
+        self.assertEqual(
+            self.route_row(output, "todo:tasks"),
+            ["1", "1", "0", "0", "0", "0"])
+        self.assertEqual(
+            self.route_row(output, "todo:index"),
+            ["1", "0", "1", "0", "0", "0"])
+
+    def test_reports_client_errors_separately(self):
+        output, errors = self.replay(
+            {"method": "GET", "path": "/todo/tasks/",
+             "user": "missing@example.com"},
+        )
+
+        self.assertEqual(
+            self.route_row(output, "todo:tasks"),
+            ["1", "0", "0", "0", "0", "1"])
+        self.assertIn("todo:tasks: 1 request(s) failed", errors)
+        self.assertIn("DoesNotExist", errors)
+
+    def test_skips_unknown_methods(self):
+        output, _ = self.replay(
+            {"method": "login", "path": "/todo/"},
+            {"method": "GET", "path": "/todo/"},
+        )
+
+        self.assertIn("Replayed 1 request(s)", output)
+        self.assertIn("skipped 2 line(s)", output)
+
+    def test_skips_asgi_only_routes_in_process(self):
+        output, _ = self.replay(
+            {"method": "GET", "path": "/todo/tasks/events/",
+             "user": "owner@example.com"},
+        )
+
+        self.assertIn("Replayed 0 request(s)", output)
+        self.assertIn("Skipped 1 request(s) to ASGI-only routes", output)
+        self.assertNotIn("todo:task_events", output)
+
+
+class EstimatedCountPaginatorTest(TestCase):
+    def setUp(self):
+        owner = User.objects.create_user("owner@example.com", "pw")
+        Task.objects.bulk_create(
+            [Task(title="task", owner=owner, status=i % 2 == 0)
+             for i in range(4)])
+
+    def paginator(self, queryset, estimate):
+        paginator = EstimatedCountPaginator(queryset, 2)
+        paginator.estimated_count = lambda: estimate
+        return paginator
+
+    def test_uses_estimate_for_large_unfiltered_tables(self):
+        paginator = self.paginator(Task.objects.all(), 50000)
+        self.assertEqual(paginator.count, 50000)
+
+    def test_counts_small_tables_exactly(self):
+        paginator = self.paginator(Task.objects.all(), 10)
+        self.assertEqual(paginator.count, 4)
+
+    def test_counts_filtered_querysets_exactly(self):
+        paginator = self.paginator(Task.objects.filter(status=True), 50000)
+        self.assertEqual(paginator.count, 2)
+
+    def test_falls_back_without_statistics(self):
+        # SQLite keeps no row estimate.
+        paginator = EstimatedCountPaginator(Task.objects.all(), 2)
+        self.assertIsNone(paginator.estimated_count())
+        self.assertEqual(paginator.count, 4)
+
+
+class TaskAdminTest(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser("admin@example.com", "pw")
+        self.client.force_login(self.admin)
+        self.tasks = [
+            Task.objects.create(title=title, owner=self.admin)
+            for title in ["buy milk", "buy bread", "walk"]
+        ]
+
+    def test_bulk_status_change_publishes_events(self):
+        ids = [self.tasks[0].id, self.tasks[1].id]
+        with mock.patch.object(broker, "publish") as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post(reverse("admin:todo_app_task_changelist"), {
+                    "action": "mark_completed", "_selected_action": ids})
+
+        self.assertEqual(
+            set(Task.objects.filter(status=True).values_list("id", flat=True)),
+            set(ids))
+        self.assertEqual(
+            sorted((call.args[1]["id"], call.args[1]["status"])
+                   for call in publish.call_args_list),
+            sorted((task_id, True) for task_id in ids))
+
+    def test_quoted_search_matches_multi_word_titles(self):
+        response = self.client.get(
+            reverse("admin:todo_app_task_changelist"), {"q": '"buy milk"'})
+        self.assertEqual(
+            [task.title for task in response.context["cl"].result_list],
+            ["buy milk"])
+
+
+class TaskAdminBatchTest(TransactionTestCase):
+    def test_bulk_status_change_commits_per_batch(self):
+        admin = User.objects.create_superuser("admin@example.com", "pw")
+        self.client.force_login(admin)
+        ids = [Task.objects.create(title="task", owner=admin).id
+               for _ in range(3)]
+
+        # Events are published when their batch commits; record how many
+        # tasks were committed as completed at that point.
+        completed = []
+
+        def publish(owner_id, event):
+            completed.append(Task.objects.filter(status=True).count())
+
+        with mock.patch.object(broker, "publish", publish), \
+                mock.patch("todo_app.admin.TaskAdmin.update_batch_size", 2):
+            self.client.post(reverse("admin:todo_app_task_changelist"), {
+                "action": "mark_completed", "_selected_action": ids})
+
+        self.assertEqual(completed, [2, 2, 3])
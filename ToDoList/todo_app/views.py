@@ -1,12 +1,26 @@
-from django.http import HttpResponseRedirect
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, HttpResponseRedirect,\
+    HttpResponseForbidden, JsonResponse, StreamingHttpResponse
+from django.views import View
 from django.views.generic import TemplateView, ListView
 from django.contrib.auth.mixins import LoginRequiredMixin
-from todo_app.models import Task
+from todo_app.events import broker, task_event
+from todo_app.models import Task, TaskArchive
 from django.views.generic.detail import DetailView
 from django.views.generic.edit import CreateView, DeleteView
 from django.urls import reverse_lazy
 
 
+def is_fetch(request):
+    """Return True for requests sent by the task list's fetch() calls."""
+    return request.headers.get("X-Requested-With") == "XMLHttpRequest"
+
+
 class IndexView(LoginRequiredMixin, TemplateView):
     """
     A simple view for testing
@@ -38,6 +52,29 @@ class TaskListView(ListView):
         return query_set
 
 
+class TaskArchiveListView(LoginRequiredMixin, ListView):
+    """
+    This class displays the archived (completed) tasks of the current user.
+    Archived tasks live in the TaskArchive table, so this view is the only
+    place that reads it and the results are paginated.
+
+    Attributes:
+        template_name (str): The name of the HTML template used to
+        render the view.
+        context_object_name (str): The name of the variable used to
+        store the list of archived tasks in the context.
+        paginate_by (int): The number of archived tasks shown per page.
+    """
+    template_name = "todo_app/task_archive.html"
+    context_object_name = "task_list"
+    paginate_by = 50
+
+    def get_queryset(self):
+        query_set = TaskArchive.objects.filter(
+            owner=self.request.user.id).order_by("-id")
+        return query_set
+
+
 class TaskDetailView(DetailView):
     """
     This class displays a detailed view of a single Task instance.
@@ -64,7 +101,10 @@ class TaskCreateView(CreateView):
         form_valid(self, form): Overrides the default implementation of
         form_valid method. If the form is valid, it saves the associated
         model and sets its owner as the current user.
-        Then it redirects to success_url.
+        Then it redirects to success_url, or answers a fetch() request
+        from the task list with the new task as JSON.
+        form_invalid(self, form): Answers a fetch() request with the form
+        errors as JSON instead of rendering the form page.
 
     """
     model = Task
@@ -77,13 +117,21 @@ class TaskCreateView(CreateView):
         self.object = form.save(commit=False)
         self.object.owner = self.request.user
         self.object.save()
+        if is_fetch(self.request):
+            return JsonResponse(task_event("created", self.object))
         return HttpResponseRedirect(self.get_success_url())
 
+    def form_invalid(self, form):
+        if is_fetch(self.request):
+            return JsonResponse({"errors": form.errors}, status=400)
+        return super().form_invalid(form)
+
 
 class TaskDeleteView(DeleteView):
     """
     this class-based view allows users to delete a specific Task object.
-    Upon successful deletion, the user is redirected to the main tasks list page.
+    Upon successful deletion, the user is redirected to the main tasks list page,
+    or a fetch() request from the task list gets the deleted task as JSON.
 
     Attributes:
         model (Task): The Task model to be deleted.
@@ -92,3 +140,61 @@ class TaskDeleteView(DeleteView):
     """
     model = Task
     success_url = reverse_lazy("todo:tasks")
+
+    def form_valid(self, form):
+        if is_fetch(self.request):
+            event = task_event("deleted", self.object)
+            self.object.delete()
+            return JsonResponse(event)
+        return super().form_valid(form)
+
+
+class TaskEventsView(View):
+    """
+    An async view that streams the current user's task changes as
+    server-sent events, so an open task list can patch itself instead of
+    reloading the page.
+
+    Events come from the in-process broker fed by the Task save and delete
+    signals. While no event arrives a comment line is sent every
+    heartbeat_interval seconds to keep the connection open through proxies.
+    The stream only works under ToDoList/asgi.py, where an idle subscriber
+    is a pending coroutine. A WSGI server would buffer the endless stream
+    and hold a worker thread forever, so other requests get a 501.
+
+    Attributes:
+        heartbeat_interval (int): Seconds between keep-alive comments.
+        retry (int): Milliseconds the browser waits before reconnecting.
+    """
+    heartbeat_interval = 15
+    retry = 5000
+
+    async def get(self, request, *args, **kwargs):
+        if not isinstance(request, ASGIRequest):
+            return HttpResponse(
+                "Task events require an ASGI server.", status=501)
+
+        user = await sync_to_async(get_user)(request)
+        if not user.is_authenticated:
+            return HttpResponseForbidden()
+
+        response = StreamingHttpResponse(
+            self.stream(user.id), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def stream(self, owner_id):
+        queue = broker.subscribe(owner_id)
+        try:
+            yield f"retry: {self.retry}\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), self.heartbeat_interval)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: task\ndata: {json.dumps(event)}\n\n"
+        finally:
+            broker.unsubscribe(owner_id, queue)